@@ -9,13 +9,17 @@ from typing import List, Dict, Optional, Any
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from gcal_transport import CalendarTransport
+
 # SCOPES define the level of access.
 # We only need read access for an exporter.
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 
+# Only the event fields used by save_to_csv are requested from the API.
+EVENT_FIELDS = ('summary', 'start', 'end', 'description', 'location', 'htmlLink')
+
 def parse_arguments() -> argparse.Namespace:
     """Parses command line arguments."""
     parser = argparse.ArgumentParser(
@@ -128,41 +132,21 @@ def parse_event_time(event_date_obj: Dict[str, Any]) -> str:
         return f"{event_date_obj['date']} (All Day)"
     return "Unknown"
 
-def fetch_events(service, calendar_id: str, start_iso: str, end_iso: str, max_total: int) -> List[Dict]:
-    """Fetches events from the API, handling pagination automatically."""
-    events_result = []
-    page_token = None
-
+def fetch_events(transport: CalendarTransport, calendar_id: str, start_iso: str, end_iso: str, max_total: int) -> List[Dict]:
+    """Fetches events from the API, handling pagination and retries automatically."""
     print(f"Fetching events from {start_iso} to {end_iso}...")
 
-    while True:
-        try:
-            # Fetch a page of events
-            events_list_request = service.events().list(
-                calendarId=calendar_id,
-                timeMin=start_iso,
-                timeMax=end_iso,
-                maxResults=min(500, max_total - len(events_result)), # Fetch chunks of 500
-                singleEvents=True,
-                orderBy='startTime',
-                pageToken=page_token
-            )
-            current_page = events_list_request.execute()
-            
-            events = current_page.get('items', [])
-            events_result.extend(events)
-            
-            page_token = current_page.get('nextPageToken')
-            
-            # Stop if no more pages or we hit the user-defined limit
-            if not page_token or len(events_result) >= max_total:
-                break
-
-        except HttpError as error:
-            print(f"An API error occurred: {error}")
-            sys.exit(1)
-
-    return events_result[:max_total]
+    try:
+        return transport.list_events(
+            calendar_id,
+            time_min=start_iso,
+            time_max=end_iso,
+            max_total=max_total,
+            item_fields=EVENT_FIELDS
+        )
+    except HttpError as error:
+        print(f"An API error occurred: {error}")
+        sys.exit(1)
 
 def save_to_csv(events: List[Dict], filename: str):
     """Writes the list of event dictionaries to a CSV file."""
@@ -200,7 +184,7 @@ def main():
 
     # 1. Authenticate
     creds = authenticate_google_calendar(args.credentials)
-    service = build('calendar', 'v3', credentials=creds)
+    transport = CalendarTransport(creds)
 
     # 2. Prepare Dates
     # If start is missing, default to now.
@@ -217,7 +201,8 @@ def main():
         end_iso = end_dt.isoformat() + 'Z'
 
     # 3. Fetch Data
-    events = fetch_events(service, args.calendar_id, start_iso, end_iso, args.max_results)
+    events = fetch_events(transport, args.calendar_id, start_iso, end_iso, args.max_results)
+    print(f"API usage: {transport.stats}")
 
     # 4. Export
     save_to_csv(events, args.output)
@@ -18,12 +18,18 @@ from mysql.connector import Error as MySQLError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+
+from gcal_transport import CalendarTransport
 
 # Configuration
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 TOKEN_FILE = 'token.json'
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# Only the event fields used by upsert_event are requested from the API.
+EVENT_FIELDS = (
+    'id', 'summary', 'description', 'location', 'status', 'htmlLink',
+    'created', 'updated', 'start', 'end'
+)
 
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
@@ -32,7 +38,7 @@ class CalendarDBSync:
     def __init__(self, args: argparse.Namespace):
         self.args = args
         self.creds = None
-        self.service = None
+        self.transport = None
         self.db_conn = None
         self.cursor = None
 
@@ -58,7 +64,7 @@ class CalendarDBSync:
                 with open(TOKEN_FILE, 'w') as token:
                     token.write(self.creds.to_json())
             
-            self.service = build('calendar', 'v3', credentials=self.creds)
+            self.transport = CalendarTransport(self.creds)
             logger.info("Google Authentication successful.")
             
         except Exception as e:
@@ -82,7 +88,7 @@ class CalendarDBSync:
             sys.exit(1)
 
     def init_db_schema(self) -> None:
-        """Creates the events table if it does not exist."""
+        """Creates the events table and its full-text index if they do not exist."""
         table_schema = """
         CREATE TABLE IF NOT EXISTS events (
             id VARCHAR(255) PRIMARY KEY,
@@ -95,11 +101,27 @@ class CalendarDBSync:
             status VARCHAR(50),
             created_at DATETIME,
             updated_at DATETIME,
-            last_synced TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            last_synced TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            FULLTEXT KEY ft_events_text (summary, description) WITH PARSER ngram
         ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
         """
+        # Tables created before the index was added to the schema lack it,
+        # and /api/search fails with "Can't find FULLTEXT index" without it.
+        index_check = """
+        SELECT COUNT(*) FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = 'events'
+          AND index_name = 'ft_events_text';
+        """
+        add_index = """
+        ALTER TABLE events
+        ADD FULLTEXT KEY ft_events_text (summary, description) WITH PARSER ngram;
+        """
         try:
             self.cursor.execute(table_schema)
+            self.cursor.execute(index_check)
+            if self.cursor.fetchall()[0][0] == 0:
+                logger.info("Adding missing full-text index to events table...")
+                self.cursor.execute(add_index)
             self.db_conn.commit()
             logger.info("Database schema verified/created.")
         except MySQLError as e:
@@ -130,16 +152,13 @@ class CalendarDBSync:
         logger.info(f"Fetching max {self.args.max_results} events...")
         now = datetime.datetime.utcnow().isoformat() + 'Z'  # 'Z' indicates UTC time
         
-        events_result = self.service.events().list(
-            calendarId='primary', 
-            timeMin=now,
-            maxResults=self.args.max_results, 
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-        
-        events = events_result.get('items', [])
-        logger.info(f"Retrieved {len(events)} events from Google API.")
+        events = self.transport.list_events(
+            'primary',
+            time_min=now,
+            max_total=self.args.max_results,
+            item_fields=EVENT_FIELDS
+        )
+        logger.info(f"Retrieved {len(events)} events from Google API ({self.transport.stats}).")
         return events
 
     def upsert_event(self, event: Dict[str, Any]) -> None:
@@ -0,0 +1,187 @@
+"""
+Shared Google Calendar API transport for the app/ tools.
+Description: Wraps the Calendar API client with a pooled keep-alive HTTP
+connection, partial responses (`fields=`), token-bucket rate limiting and
+jittered exponential backoff on quota / server errors.
+"""
+
+import json
+import time
+import random
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Iterable
+
+# Third-party libraries
+import httplib2
+import google_auth_httplib2
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# Google reports short-term rate limiting as 403 with one of these reasons.
+# `quotaExceeded` (usage limit reached) is not retried: waiting a few
+# seconds does not clear it.
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class TransportStats:
+    """
+    Counters for traffic sent through a CalendarTransport.
+    `requests` counts every HTTP attempt, including ones that fail with a
+    connection error. `bytes_received` is the size of the response bodies
+    after httplib2 decompresses them, not the gzip bytes on the wire.
+    """
+    requests: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+
+    def __str__(self) -> str:
+        return (f"requests={self.requests} retries={self.retries} "
+                f"bytes={self.bytes_received}")
+
+
+class TokenBucket:
+    """Simple token bucket: `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then consumes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class _CountingHttp(httplib2.Http):
+    """httplib2.Http that records request and payload counters."""
+
+    def __init__(self, stats: TransportStats, timeout: Optional[float] = None):
+        super().__init__(timeout=timeout)
+        self.stats = stats
+
+    def request(self, *args, **kwargs):
+        self.stats.requests += 1
+        resp, content = super().request(*args, **kwargs)
+        self.stats.bytes_received += len(content or b'')
+        return resp, content
+
+
+def _error_reason(error: HttpError) -> str:
+    """Extracts the first `reason` from a Google API error body."""
+    try:
+        body = json.loads(error.content.decode('utf-8'))
+        errors = body.get('error', {}).get('errors', [])
+        if errors:
+            return errors[0].get('reason', '')
+    except (ValueError, AttributeError):
+        pass
+    return ''
+
+
+def is_retryable(error: HttpError) -> bool:
+    """True for 429/5xx and 403 responses caused by rate limiting."""
+    status = error.resp.status
+    if status in RETRYABLE_STATUS:
+        return True
+    return status == 403 and _error_reason(error) in RATE_LIMIT_REASONS
+
+
+class CalendarTransport:
+    """
+    Calendar API client sharing one keep-alive connection per process.
+    All calls go through `execute`, which rate-limits and retries.
+    """
+
+    def __init__(self, creds, rate: float = 5.0, burst: int = 10,
+                 max_retries: int = 5, base_delay: float = 1.0,
+                 max_delay: float = 32.0, timeout: Optional[float] = 60):
+        self.stats = TransportStats()
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        # A single httplib2.Http keeps its connections open between calls.
+        self.http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=_CountingHttp(self.stats, timeout=timeout))
+        self.service = build('calendar', 'v3', http=self.http, cache_discovery=False)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay for the given retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def execute(self, request) -> Dict[str, Any]:
+        """Executes an API request, retrying quota and server errors."""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                return request.execute()
+            except HttpError as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                reason = f"HTTP {e.resp.status}"
+            except (ConnectionError, TimeoutError, httplib2.HttpLib2Error) as e:
+                if attempt >= self.max_retries:
+                    raise
+                reason = repr(e)
+
+            delay = self._backoff(attempt)
+            attempt += 1
+            self.stats.retries += 1
+            logger.warning(f"{reason}; retry {attempt}/{self.max_retries} in {delay:.1f}s")
+            time.sleep(delay)
+
+    def list_events(self, calendar_id: str, time_min: str,
+                    time_max: Optional[str] = None, max_total: int = 2500,
+                    item_fields: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Fetches events with pagination, requesting only `item_fields`
+        for each event (all fields if empty).
+        """
+        events_result = []
+        page_token = None
+        fields = 'nextPageToken'
+        if item_fields:
+            fields += f",items({','.join(item_fields)})"
+        else:
+            fields += ',items'
+
+        while len(events_result) < max_total:
+            params = dict(
+                calendarId=calendar_id,
+                timeMin=time_min,
+                maxResults=min(2500, max_total - len(events_result)),
+                singleEvents=True,
+                orderBy='startTime',
+                fields=fields,
+            )
+            if time_max:
+                params['timeMax'] = time_max
+            if page_token:
+                params['pageToken'] = page_token
+
+            current_page = self.execute(self.service.events().list(**params))
+            events_result.extend(current_page.get('items', []))
+
+            page_token = current_page.get('nextPageToken')
+            if not page_token:
+                break
+
+        return events_result[:max_total]
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Ensure app/ (one level up from this file) is on sys.path so that the
+# top-level tool modules like `gcal_transport` can be imported.
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
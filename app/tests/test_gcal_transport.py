@@ -0,0 +1,186 @@
+import json
+import pytest
+import httplib2
+from googleapiclient.errors import HttpError
+
+import gcal_transport
+from gcal_transport import CalendarTransport, is_retryable
+
+
+def make_error(status, reason=None, content=None):
+    if content is None:
+        errors = [{"reason": reason}] if reason else []
+        content = json.dumps({"error": {"code": status, "errors": errors}}).encode("utf-8")
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+class FakeRequest:
+    """Stub whose execute() returns (or raises) the given outcomes in order."""
+
+    def __init__(self, outcomes, params=None):
+        self.outcomes = list(outcomes)
+        self.params = params
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class FakeEvents:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.requests = []
+
+    def list(self, **params):
+        request = FakeRequest([self.pages.pop(0)], params)
+        self.requests.append(request)
+        return request
+
+
+class FakeService:
+    def __init__(self, pages=()):
+        self.fake_events = FakeEvents(pages)
+
+    def events(self):
+        return self.fake_events
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(gcal_transport.time, "sleep", delays.append)
+    monkeypatch.setattr(gcal_transport.random, "uniform", lambda a, b: b)
+    return delays
+
+
+@pytest.fixture
+def make_transport(monkeypatch):
+    def factory(pages=(), **kwargs):
+        service = FakeService(pages)
+        monkeypatch.setattr(gcal_transport, "build", lambda *a, **k: service)
+        return CalendarTransport(None, rate=1000, burst=1000, **kwargs)
+    return factory
+
+
+@pytest.mark.parametrize("error, expected", [
+    (make_error(403, "rateLimitExceeded"), True),
+    (make_error(403, "userRateLimitExceeded"), True),
+    (make_error(403, "quotaExceeded"), False),
+    (make_error(403, "forbidden"), False),
+    (make_error(403, content=b"<html>Forbidden</html>"), False),
+    (make_error(404, "notFound"), False),
+    (make_error(429, "rateLimitExceeded"), True),
+    (make_error(500, content=b"not json"), True),
+    (make_error(503), True),
+])
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+def test_execute_retries_then_succeeds(make_transport, no_sleep):
+    transport = make_transport(base_delay=1.0)
+    request = FakeRequest([make_error(429), make_error(500), {"items": []}])
+
+    assert transport.execute(request) == {"items": []}
+    assert request.calls == 3
+    assert transport.stats.retries == 2
+    # random.uniform is pinned to its upper bound, so delays double.
+    assert no_sleep == [1.0, 2.0]
+
+
+def test_execute_gives_up_after_max_retries(make_transport, no_sleep):
+    transport = make_transport(max_retries=2)
+    request = FakeRequest([make_error(503)] * 3)
+
+    with pytest.raises(HttpError):
+        transport.execute(request)
+    assert request.calls == 3
+    assert transport.stats.retries == 2
+
+
+def test_execute_does_not_retry_client_errors(make_transport, no_sleep):
+    transport = make_transport()
+    request = FakeRequest([make_error(403, "forbidden")])
+
+    with pytest.raises(HttpError):
+        transport.execute(request)
+    assert request.calls == 1
+    assert transport.stats.retries == 0
+    assert no_sleep == []
+
+
+def test_execute_retries_connection_errors(make_transport, no_sleep):
+    transport = make_transport(max_delay=0.5)
+    request = FakeRequest([ConnectionResetError(), TimeoutError(), {"ok": True}])
+
+    assert transport.execute(request) == {"ok": True}
+    assert transport.stats.retries == 2
+    assert no_sleep == [0.5, 0.5]
+
+
+def test_list_events_requests_only_item_fields(make_transport):
+    transport = make_transport(pages=[{"items": [{"id": "a"}]}])
+
+    events = transport.list_events("primary", "2025-01-01T00:00:00Z",
+                                   item_fields=("id", "summary"))
+
+    assert events == [{"id": "a"}]
+    params = transport.service.events().requests[0].params
+    assert params["fields"] == "nextPageToken,items(id,summary)"
+    assert "pageToken" not in params
+    assert "timeMax" not in params
+
+
+def test_list_events_follows_pages_until_no_token(make_transport):
+    pages = [
+        {"items": [{"id": "a"}], "nextPageToken": "p2"},
+        {"items": [{"id": "b"}]},
+    ]
+    transport = make_transport(pages=pages)
+
+    events = transport.list_events("primary", "2025-01-01T00:00:00Z",
+                                   time_max="2025-02-01T00:00:00Z")
+
+    assert [e["id"] for e in events] == ["a", "b"]
+    requests = transport.service.events().requests
+    assert len(requests) == 2
+    assert requests[0].params["fields"] == "nextPageToken,items"
+    assert requests[1].params["pageToken"] == "p2"
+    assert requests[1].params["timeMax"] == "2025-02-01T00:00:00Z"
+
+
+def test_list_events_truncates_to_max_total(make_transport):
+    pages = [
+        {"items": [{"id": "a"}, {"id": "b"}], "nextPageToken": "p2"},
+        {"items": [{"id": "c"}, {"id": "d"}], "nextPageToken": "p3"},
+    ]
+    transport = make_transport(pages=pages)
+
+    events = transport.list_events("primary", "2025-01-01T00:00:00Z", max_total=3)
+
+    assert [e["id"] for e in events] == ["a", "b", "c"]
+    requests = transport.service.events().requests
+    assert [r.params["maxResults"] for r in requests] == [3, 1]
+
+
+def test_counting_http_counts_failed_attempts(monkeypatch):
+    stats = gcal_transport.TransportStats()
+    http = gcal_transport._CountingHttp(stats)
+
+    def fail(self, *args, **kwargs):
+        raise ConnectionResetError()
+
+    monkeypatch.setattr(httplib2.Http, "request", fail)
+    with pytest.raises(ConnectionResetError):
+        http.request("https://example.invalid/")
+
+    monkeypatch.setattr(httplib2.Http, "request",
+                        lambda self, *a, **k: (httplib2.Response({"status": 200}), b"12345"))
+    http.request("https://example.invalid/")
+
+    assert stats.requests == 2
+    assert stats.bytes_received == 5
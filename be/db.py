@@ -1,12 +1,138 @@
-"""Compatibility shim for `be.db`.
+"""Database access for the kac-be API.
 
-The real implementation lives in `be/src/db.py`; tests and other modules
-import `be.db`, so re-export the implementation here.
+`be/main.py` imports this module as `db` and the tests import it as
+`be.db`; both load this file, so the helpers are defined directly here.
 """
-#from be.src import db as _db
-import db as _db
+import os
+import re
+import threading
+import time
 
-# Re-export names from the implementation module
-__all__ = [name for name in dir(_db) if not name.startswith("_")]
-for _name in __all__:
-    globals()[_name] = getattr(_db, _name)
+import mysql.connector.pooling
+
+__all__ = ["search_records"]
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _connect():
+    """プールから接続を取り出す。close() でプールに返却される"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name="kacbe",
+                pool_size=int(os.getenv("MYSQL_POOL_SIZE", "10")),
+                host=os.getenv("MYSQL_HOST", "localhost"),
+                database=os.getenv("MYSQL_DATABASE"),
+                user=os.getenv("MYSQL_USER"),
+                password=os.getenv("MYSQL_PASSWORD"),
+            )
+    return _pool.get_connection()
+
+
+def _boolean_query(q):
+    """空白区切りの各語を必須フレーズにした BOOLEAN MODE 用クエリを作る
+
+    ngram_token_size (既定 2) 未満の語はインデックスに載らないため除外する
+    """
+    words = [w.replace('"', "") for w in re.split(r"\s+", q.strip())]
+    return " ".join(f'+"{w}"' for w in words if len(w) >= 2)
+
+
+# ngram FULLTEXT インデックスを使った横断検索。
+# 各テーブルで先に上位 offset+limit+1 件だけを取り出してから結合するので、
+# 結合後にソートするのは高々 2 * (offset+limit+1) 件で済む。
+# 同点のスコアはよくある (同じ団体の予約はすべて同じスコアになる) ため、
+# 内側と外側で一意なキーまで含めた同じ順序を使い、ページ間で結果がずれないようにする。
+_ORDER = "score DESC, start_time DESC, `key`"
+
+_RESERVATION_SQL = f"""
+    (SELECT 'reservation' AS source,
+            CONCAT(`id`, '-', `reservation_number`) AS `key`,
+            `organization_name` AS title,
+            `facility_name` AS detail,
+            TIMESTAMP(`date`, `start_time`) AS start_time,
+            MATCH(`organization_name`, `facility_name`) AGAINST (%s IN BOOLEAN MODE) AS score
+     FROM `reservation_data`
+     WHERE MATCH(`organization_name`, `facility_name`) AGAINST (%s IN BOOLEAN MODE)
+     ORDER BY {_ORDER}
+     LIMIT %s)"""
+
+_EVENT_SQL = f"""
+    (SELECT 'event' AS source,
+            `id` AS `key`,
+            `summary` AS title,
+            `location` AS detail,
+            `start_time`,
+            MATCH(`summary`, `description`) AGAINST (%s IN BOOLEAN MODE) AS score
+     FROM `events`
+     WHERE MATCH(`summary`, `description`) AGAINST (%s IN BOOLEAN MODE)
+     ORDER BY {_ORDER}
+     LIMIT %s)"""
+
+# 2つのインデックスのスコアは尺度が異なるため、テーブルごとの最大値で
+# 0〜1 に正規化する。全件が同じ語を含むと IDF が 0 になり最大値も 0 になるので、
+# その場合は 0 とする。
+_OUTER_SQL = """
+SELECT source, `key`, title, detail, start_time,
+       COALESCE(score / NULLIF(MAX(score) OVER (PARTITION BY source), 0), 0) AS score
+FROM ({inner}
+) AS hits
+ORDER BY score DESC, start_time DESC, source, `key`
+LIMIT %s OFFSET %s
+"""
+
+# events は app/gcal_sync_tool.py が作成するため、同期前は存在しないことがある
+_EVENTS_INDEX_SQL = """
+SELECT COUNT(*) AS n FROM information_schema.statistics
+WHERE table_schema = DATABASE() AND table_name = 'events'
+  AND index_name = 'ft_events_text'
+"""
+_EVENTS_INDEX_TTL = 60
+_events_index = {"ready": False, "checked_at": None}
+
+
+def _search_sql(include_events):
+    inner = _RESERVATION_SQL
+    if include_events:
+        inner += "\n    UNION ALL" + _EVENT_SQL
+    return _OUTER_SQL.format(inner=inner)
+
+
+def _events_searchable(cur):
+    """events テーブルの FULLTEXT インデックスがあるか (結果は一定時間キャッシュする)"""
+    checked_at = _events_index["checked_at"]
+    now = time.monotonic()
+    if checked_at is None or now - checked_at > _EVENTS_INDEX_TTL:
+        cur.execute(_EVENTS_INDEX_SQL)
+        _events_index["ready"] = cur.fetchall()[0]["n"] > 0
+        _events_index["checked_at"] = now
+    return _events_index["ready"]
+
+
+def search_records(q, limit=20, offset=0):
+    """団体名・施設名・イベント概要を部分一致検索し、スコア順に返す
+
+    2文字以上の語が1つもない場合は ValueError を送出する
+    """
+    query = _boolean_query(q)
+    if not query:
+        raise ValueError("検索語は2文字以上で入力してください")
+
+    per_table = offset + limit + 1
+    conn = _connect()
+    try:
+        cur = conn.cursor(dictionary=True)
+        include_events = _events_searchable(cur)
+        params = [query, query, per_table]
+        if include_events:
+            params += [query, query, per_table]
+        cur.execute(_search_sql(include_events), (*params, limit + 1, offset))
+        rows = cur.fetchall()
+        cur.close()
+    finally:
+        conn.close()
+
+    return {"has_more": len(rows) > limit, "items": rows[:limit]}
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List
 import os
@@ -33,6 +33,21 @@ def get_reservations():
         raise HTTPException(status_code=500, detail="データベースエラーが発生しました")
 
 
+@app.get("/api/search")
+def search(
+    q: str = Query(...),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000),
+):
+    try:
+        result = db.search_records(q, limit=limit, offset=offset)
+        return {"limit": limit, "offset": offset, **result}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="データベースエラーが発生しました")
+
+
 @app.post("/api/import-csv")
 def import_csv(file: UploadFile = File(...)):
     if file.content_type not in ("text/csv", "application/vnd.ms-excel", "text/plain"):
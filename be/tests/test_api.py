@@ -2,6 +2,7 @@ import io
 import pytest
 from fastapi.testclient import TestClient
 
+from be import main
 from be.main import app
 from be import db
 
@@ -41,3 +42,98 @@ def test_import_csv(monkeypatch):
 
     assert resp.status_code == 200
     assert "件のレコードをインポートしました" in resp.json()["message"]
+
+
+
+def test_search(monkeypatch):
+    sample = {
+        "has_more": False,
+        "items": [
+            {"source": "reservation", "key": "1-123", "title": "団体A", "detail": "ホール", "start_time": "2025-01-01T10:00:00", "score": 1.0}
+        ],
+    }
+    calls = []
+
+    def fake_search(q, limit, offset):
+        calls.append((q, limit, offset))
+        return sample
+
+    # main は `import db` で読み込んだモジュールを参照する
+    monkeypatch.setattr(main.db, "search_records", fake_search)
+
+    resp = client.get("/api/search", params={"q": "団体", "limit": 10, "offset": 5})
+    assert resp.status_code == 200
+    assert resp.json() == {"limit": 10, "offset": 5, **sample}
+    assert calls == [("団体", 10, 5)]
+
+
+@pytest.mark.parametrize("q", ["団", "a 団"])
+def test_search_rejects_short_terms(q):
+    # 2文字以上の語がなければ DB に接続する前に 400 を返す
+    resp = client.get("/api/search", params={"q": q})
+    assert resp.status_code == 400
+
+
+def test_boolean_query():
+    assert db._boolean_query("団体 ホール") == '+"団体" +"ホール"'
+    assert db._boolean_query("団体\u3000ホール") == '+"団体" +"ホール"'
+    assert db._boolean_query("a 団") == ""
+    assert db._boolean_query('団"体') == '+"団体"'
+
+
+@pytest.mark.parametrize("include_events", [True, False])
+def test_search_sql_orders_deterministically(include_events):
+    # 同点のスコアでもページ間で結果がずれないよう、一意なキーまで並べる
+    sql = " ".join(db._search_sql(include_events).split())
+    inner = "ORDER BY score DESC, start_time DESC, `key` LIMIT %s)"
+    assert sql.count(inner) == (2 if include_events else 1)
+    assert "ORDER BY score DESC, start_time DESC, source, `key` LIMIT %s OFFSET %s" in sql
+    assert "NULLIF(MAX(score) OVER (PARTITION BY source), 0)" in sql
+    assert ("FROM `events`" in sql) is include_events
+
+
+class FakeCursor:
+    def __init__(self, events_index):
+        self.events_index = events_index
+        self.executed = []
+
+    def execute(self, sql, params=()):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        sql, _ = self.executed[-1]
+        if "information_schema" in sql:
+            return [{"n": 1 if self.events_index else 0}]
+        return [{"key": str(i)} for i in range(3)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self.fake_cursor = cursor
+        self.closed = False
+
+    def cursor(self, dictionary=False):
+        return self.fake_cursor
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("events_index", [True, False])
+def test_search_records_skips_missing_events_index(monkeypatch, events_index):
+    cursor = FakeCursor(events_index)
+    conn = FakeConnection(cursor)
+    monkeypatch.setattr(db, "_connect", lambda: conn)
+    monkeypatch.setitem(db._events_index, "checked_at", None)
+
+    result = db.search_records("団体", limit=2, offset=4)
+
+    sql, params = cursor.executed[-1]
+    assert ("FROM `events`" in sql) is events_index
+    assert sql.count("%s") == len(params)
+    assert params[-2:] == (3, 4)
+    assert result == {"has_more": True, "items": [{"key": "0"}, {"key": "1"}]}
+    assert conn.closed
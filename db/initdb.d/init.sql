@@ -21,5 +21,6 @@ CREATE TABLE `reservation_data` (
     `day_of_week` CHAR(1) NOT NULL COMMENT '利用曜日',
     `start_time` TIME NOT NULL COMMENT '利用開始時刻 (HH:MM:SS形式)',
     `end_time` TIME NOT NULL COMMENT '利用終了時刻 (HH:MM:SS形式)',
-    PRIMARY KEY (`id`, `reservation_number`)
-);
\ No newline at end of file
+    PRIMARY KEY (`id`, `reservation_number`),
+    FULLTEXT KEY `ft_reservation_text` (`organization_name`, `facility_name`) WITH PARSER ngram
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
\ No newline at end of file